@@ -9,15 +9,74 @@ The actual implementations use proprietary algorithms for semantic-to-musical
 mapping and optimized Magenta models converted to TensorFlow Lite.
 """
 
+from __future__ import annotations
+
+import time
 from abc import ABC, abstractmethod
-from typing import List, Dict, Optional, Union, Callable, Any
-from dataclasses import dataclass
+from operator import attrgetter
+from typing import List, Dict, Iterator, Optional, Union, Callable, Any, TYPE_CHECKING
+from dataclasses import dataclass, field
 from enum import Enum
-import numpy as np
+
+if TYPE_CHECKING:
+    import numpy as np
+    import numpy.typing as npt
+
+# NumPy is only needed by the mock generator's synthesis path; apps
+# importing just the abstract interfaces skip its ~50 ms cold import.
+_np = None
+
+
+def _get_np():
+    """Import NumPy on first use and cache the module."""
+    global _np
+    if _np is None:
+        import numpy
+        _np = numpy
+    return _np
+
+
+def _instrument_values(instruments):
+    return list(instruments or ())
+
+
+def _key_dict(key):
+    return {"tonic": key.tonic, "mode": key.mode}
+
+
+def _time_signature_pair(time_signature):
+    return [time_signature.numerator, time_signature.denominator]
 
 
-class MusicStyle(Enum):
-    """Supported music styles for generation."""
+# Size-keyed free lists of float32 audio buffers. Clip length is
+# deterministic from (sample_rate, duration), so the pool stays at a
+# handful of buckets while saving a malloc + page-fault sweep on every
+# generation in the real-time path.
+_BUFFER_POOL: Dict[int, List["np.ndarray"]] = {}
+_POOL_MAX_PER_SIZE = 4
+
+
+def _acquire_buffer(samples: int) -> "np.ndarray":
+    """Reuse a pooled float32 buffer of this size, or allocate one."""
+    free = _BUFFER_POOL.get(samples)
+    if free:
+        return free.pop()
+    return _get_np().empty(samples, dtype="float32")
+
+
+def release_buffer(buffer: "np.ndarray") -> None:
+    """Return an audio buffer to the pool for reuse."""
+    free = _BUFFER_POOL.setdefault(len(buffer), [])
+    if len(free) < _POOL_MAX_PER_SIZE:
+        free.append(buffer)
+
+
+class MusicStyle(str, Enum):
+    """Supported music styles for generation.
+
+    Members are themselves strings, so serialization and dict insertion
+    use the member directly with no .value indirection.
+    """
     AMBIENT = "ambient"
     CLASSICAL = "classical"
     JAZZ = "jazz"
@@ -28,7 +87,7 @@ class MusicStyle(Enum):
     EXPERIMENTAL = "experimental"
 
 
-class InstrumentFamily(Enum):
+class InstrumentFamily(str, Enum):
     """Instrument families for music generation."""
     PIANO = "piano"
     STRINGS = "strings"
@@ -40,7 +99,11 @@ class InstrumentFamily(Enum):
     BASS = "bass"
 
 
-@dataclass
+# Frozen so instances hash: there are only ~7 tonics x a handful of
+# modes in practice, which makes keys and time signatures ideal
+# functools.lru_cache keys for downstream per-key work (scale tables,
+# chord voicings) without any custom __hash__ plumbing.
+@dataclass(frozen=True, slots=True)
 class MusicalKey:
     """Represents a musical key with tonic and mode."""
     tonic: str  # C, D, E, F, G, A, B
@@ -50,7 +113,7 @@ class MusicalKey:
         return f"{self.tonic} {self.mode.title()}"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TimeSignature:
     """Represents a time signature."""
     numerator: int    # beats per measure
@@ -60,7 +123,7 @@ class TimeSignature:
         return f"{self.numerator}/{self.denominator}"
 
 
-@dataclass
+@dataclass(slots=True)
 class MusicalParameters:
     """
     Comprehensive musical parameters for generation.
@@ -95,45 +158,96 @@ class MusicalParameters:
     rhythmic_complexity: float = 0.5  # 0.0 = simple, 1.0 = complex rhythms
     melodic_range: str = "medium"   # low, medium, high, wide
     
+    # Serialization spec: (field name, converter or None) pairs, walked
+    # once per to_dict call with a single batched attrgetter lookup.
+    # key and time_signature serialize as native JSON structures
+    # ({"tonic", "mode"} / [numerator, denominator]) so consumers
+    # round-trip them without re-parsing display strings.
+    _FIELDS = (
+        ("tempo", None),
+        ("key", _key_dict),
+        ("time_signature", _time_signature_pair),
+        ("style", None),
+        ("primary_instruments", _instrument_values),
+        ("secondary_instruments", _instrument_values),
+        ("energy_level", None),
+        ("complexity", None),
+        ("brightness", None),
+        ("tension", None),
+        ("duration", None),
+        ("harmonic_richness", None),
+        ("rhythmic_complexity", None),
+        ("melodic_range", None),
+    )
+    _GETTER = attrgetter(*(name for name, _ in _FIELDS))
+
     def to_dict(self) -> Dict:
         """Convert to dictionary for serialization."""
+        values = self._GETTER(self)
         return {
-            "tempo": self.tempo,
-            "key": str(self.key),
-            "time_signature": str(self.time_signature),
-            "style": self.style.value,
-            "primary_instruments": [inst.value for inst in self.primary_instruments],
-            "secondary_instruments": [inst.value for inst in self.secondary_instruments] if self.secondary_instruments else [],
-            "energy_level": self.energy_level,
-            "complexity": self.complexity,
-            "brightness": self.brightness,
-            "tension": self.tension,
-            "duration": self.duration,
-            "harmonic_richness": self.harmonic_richness,
-            "rhythmic_complexity": self.rhythmic_complexity,
-            "melodic_range": self.melodic_range
+            name: value if convert is None else convert(value)
+            for (name, convert), value in zip(self._FIELDS, values)
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class GeneratedAudio:
-    """Represents generated audio with metadata."""
-    audio_data: np.ndarray     # Audio samples
+    """Represents generated audio with metadata.
+
+    audio_data is expected to be float32: downstream synthesis on the
+    Raspberry Pi consumes int16/FP32, and FP32 halves the bytes moved
+    per clip compared to NumPy's default FP64 while keeping later DSP
+    stages on the NEON fast path.
+    """
+    audio_data: npt.NDArray[np.float32]  # Audio samples (float32)
     sample_rate: int           # Sample rate (Hz)
     duration: float            # Duration in seconds
     parameters: MusicalParameters  # Generation parameters used
-    midi_data: Optional[bytes] = None  # Optional MIDI representation
+    # Accepts bytes, bytearray or memoryview so producers can hand over
+    # a live encoder buffer without an intermediate bytes() copy.
+    midi_data: Optional[Union[bytes, bytearray, memoryview]] = None  # Optional MIDI representation
     generation_time: Optional[float] = None  # Time taken to generate
-    
+
+    # Manual memoization slots: functools.cached_property needs a
+    # __dict__, which slots=True removes. The array is immutable after
+    # construction in practice, so caching is safe.
+    _num_samples: Optional[int] = field(default=None, init=False, repr=False, compare=False)
+    _channels: Optional[int] = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Normalize stray FP64 or strided arrays at the boundary, once,
+        # rather than letting every downstream DSP stage re-check and
+        # re-copy. Arrays already contiguous float32 pass through as-is.
+        np = _get_np()
+        if self.audio_data.dtype != np.float32 or not self.audio_data.flags["C_CONTIGUOUS"]:
+            self.audio_data = np.ascontiguousarray(self.audio_data, dtype=np.float32)
+
     @property
     def num_samples(self) -> int:
         """Number of audio samples."""
-        return len(self.audio_data)
-    
+        if self._num_samples is None:
+            self._num_samples = len(self.audio_data)
+        return self._num_samples
+
     @property
     def channels(self) -> int:
         """Number of audio channels."""
-        return 1 if self.audio_data.ndim == 1 else self.audio_data.shape[1]
+        if self._channels is None:
+            self._channels = 1 if self.audio_data.ndim == 1 else self.audio_data.shape[1]
+        return self._channels
+
+    @property
+    def dtype(self) -> "np.dtype":
+        """Sample dtype of the audio buffer (float32 by convention)."""
+        return self.audio_data.dtype
+
+    def release(self) -> None:
+        """Hand the audio buffer back to the pool for reuse.
+
+        Call once the samples have been consumed (played or mixed);
+        the buffer must not be read afterwards.
+        """
+        release_buffer(self.audio_data)
 
 
 class MusicGeneratorInterface(ABC):
@@ -188,6 +302,46 @@ class MusicGeneratorInterface(ABC):
         """
         pass
     
+    def generate_music_batch(self, parameters: List[MusicalParameters]) -> List[GeneratedAudio]:
+        """
+        Generate music for several parameter sets in one call.
+
+        The default implementation loops over generate_music. Backends
+        should override it to batch along the first tensor dimension so
+        per-invocation graph-launch and allocation overhead is paid once
+        per batch rather than once per clip.
+
+        Args:
+            parameters: Parameter sets, one per requested clip
+
+        Returns:
+            Generated audio for each parameter set, in order
+        """
+        return [self.generate_music(p) for p in parameters]
+
+    def generate_music_stream(self, parameters: MusicalParameters,
+                              block_size: int = 1024) -> Iterator["np.ndarray"]:
+        """
+        Generate music as a stream of fixed-size sample blocks.
+
+        Yields float32 blocks of block_size samples (the final block may
+        be shorter), sized to match typical ALSA/JACK periods so playback
+        can start before the clip is complete. The default implementation
+        materializes the clip via generate_music and yields views into
+        it; backends should override it to synthesize incrementally so
+        peak memory is bounded by one block instead of the whole clip.
+
+        Args:
+            parameters: Musical parameters defining the desired output
+            block_size: Samples per yielded block
+
+        Yields:
+            Consecutive float32 sample blocks
+        """
+        audio = self.generate_music(parameters).audio_data
+        for offset in range(0, len(audio), block_size):
+            yield audio[offset:offset + block_size]
+
     @abstractmethod
     def get_supported_styles(self) -> List[MusicStyle]:
         """
@@ -313,13 +467,17 @@ class AudioSynthesizerInterface(ABC):
         pass
     
     @abstractmethod
-    def synthesize_midi(self, midi_data: bytes,
+    def synthesize_midi(self, midi_data: Union[bytes, bytearray, memoryview],
                        soundfont: Optional[str] = None) -> np.ndarray:
         """
         Synthesize MIDI data to audio.
-        
+
+        Implementations must treat midi_data as read-only and should
+        parse it through memoryview(midi_data) so bytearray and
+        memoryview inputs are consumed zero-copy.
+
         Args:
-            midi_data: MIDI data to synthesize
+            midi_data: MIDI data to synthesize (bytes-like, read-only)
             soundfont: Optional custom soundfont file
         
         Returns:
@@ -435,89 +593,312 @@ class RealTimeMusicProcessorInterface(ABC):
         pass
 
 
+# One second of sine per tonic at the mock's sample rate, built on
+# first use. Repeat generations tile the cached period with a memcpy
+# instead of re-evaluating sin over hundreds of thousands of samples.
+# The phase grid is sample-rate-locked (index / sample_rate), never
+# normalized over the clip duration the way np.linspace(0, duration, n)
+# spaces it: a duration-normalized grid puts its last sample exactly on
+# `duration`, so consecutively generated blocks would not concatenate
+# phase-continuously.
+# Non-integer cycle counts seam slightly at the tile boundary, which is
+# acceptable for the mock's placeholder audio.
+# Tonic frequencies ordered A..G, indexed by ord(tonic) - ord('A'):
+# constant-time tuple indexing instead of hashing a one-character
+# string per generation. A plain tuple keeps the table independent of
+# the lazy NumPy import.
+_KEY_FREQ = (440.00, 493.88, 261.63, 293.66, 329.63, 349.23, 392.00)
+
+
+def _tonic_freq(tonic: str) -> float:
+    """Frequency for a tonic letter, defaulting to A440 when invalid.
+
+    Accidentals ("C#", "Bb") take the fallback like any other
+    unmapped tonic rather than raising.
+    """
+    index = ord(tonic) - 65 if tonic and len(tonic) == 1 else -1
+    return _KEY_FREQ[index] if 0 <= index < 7 else 440.0
+
+
+_SINE_CACHE: Dict[str, "np.ndarray"] = {}
+
+
+def _sine_period(tonic: str, freq: float, sample_rate: int) -> np.ndarray:
+    """Return one cached second of a unit sine at `freq`."""
+    np = _get_np()
+    wave = _SINE_CACHE.get(tonic)
+    if wave is None or len(wave) != sample_rate:
+        wave = np.arange(sample_rate, dtype=np.float32)
+        wave *= np.float32(2.0 * np.pi * freq / sample_rate)
+        np.sin(wave, out=wave)
+        _SINE_CACHE[tonic] = wave
+    return wave
+
+
+def _fill_tiled(out: np.ndarray, wave: np.ndarray) -> None:
+    """Tile `wave` into `out` in place, without intermediate copies."""
+    total, period = len(out), len(wave)
+    pos = 0
+    while pos < total:
+        take = min(period, total - pos)
+        out[pos:pos + take] = wave[:take]
+        pos += take
+
+
+# Optional Numba kernel for the synthesis fill. When numba is installed
+# the whole phase/sin/scale loop compiles to one fused pass over the
+# buffer (no per-tonic period cache, no separate amplitude multiply,
+# exact phase with no tile seams). Resolved lazily like NumPy so that
+# neither the numba import nor the first JIT compile is paid by code
+# that never synthesizes; without numba the cache/tile path is used.
+_SINE_FILL_UNSET = object()
+_sine_fill = _SINE_FILL_UNSET
+
+
+def _get_sine_fill() -> Optional[Callable]:
+    """Return the JIT-compiled fill kernel, or None if numba is absent."""
+    global _sine_fill
+    if _sine_fill is _SINE_FILL_UNSET:
+        try:
+            from numba import njit
+        except ImportError:
+            _sine_fill = None
+        else:
+            import math
+
+            @njit(cache=True, fastmath=True)
+            def _kernel(out, freq, sample_rate, amp):
+                step = 2.0 * math.pi * freq / sample_rate
+                for i in range(out.shape[0]):
+                    out[i] = amp * math.sin(step * i)
+
+            _sine_fill = _kernel
+    return _sine_fill
+
+
+# Implementation registries. Concrete backends self-register at import
+# time via the decorators below, so factory dispatch is an O(1) dict
+# lookup instead of a string comparison chain, and the registries can
+# be walked at application boot to prewarm model loads before the
+# real-time pipeline needs them.
+_GENERATOR_REGISTRY: Dict[str, type] = {}
+_MAPPER_REGISTRY: Dict[str, type] = {}
+_SYNTHESIZER_REGISTRY: Dict[str, type] = {}
+
+
+def register_generator(name: str) -> Callable[[type], type]:
+    """Class decorator registering a MusicGeneratorInterface backend."""
+    def decorator(cls: type) -> type:
+        _GENERATOR_REGISTRY[name] = cls
+        return cls
+    return decorator
+
+
+def register_semantic_mapper(name: str) -> Callable[[type], type]:
+    """Class decorator registering a SemanticMusicMapperInterface backend."""
+    def decorator(cls: type) -> type:
+        _MAPPER_REGISTRY[name] = cls
+        return cls
+    return decorator
+
+
+def register_synthesizer(name: str) -> Callable[[type], type]:
+    """Class decorator registering an AudioSynthesizerInterface backend."""
+    def decorator(cls: type) -> type:
+        _SYNTHESIZER_REGISTRY[name] = cls
+        return cls
+    return decorator
+
+
 # Factory functions
 def create_music_generator(generator_type: str, config: Dict) -> MusicGeneratorInterface:
     """
     Factory function for creating music generators.
-    
+
+    Call once at application boot so backend model weights are loaded
+    before the first real-time frame, not in its critical path.
+
     Args:
-        generator_type: Type of generator ('magenta_tflite', 'pytorch', etc.)
+        generator_type: Type of generator ('magenta_tflite', 'mock', etc.)
         config: Generator configuration
-    
+
     Returns:
         Initialized music generator instance
     """
-    raise NotImplementedError("Music generator factory is proprietary")
+    cls = _GENERATOR_REGISTRY.get(generator_type)
+    if cls is None:
+        raise NotImplementedError(f"No music generator registered as '{generator_type}'")
+    generator = cls()
+    generator.initialize(config)
+    return generator
 
 
-def create_semantic_mapper(config: Dict) -> SemanticMusicMapperInterface:
+def create_semantic_mapper(config: Dict, mapper_type: str = "default") -> SemanticMusicMapperInterface:
     """
     Factory function for creating semantic mappers.
-    
+
     Args:
         config: Mapper configuration
-    
+        mapper_type: Registered mapper implementation name
+
     Returns:
         Initialized semantic mapper instance
     """
-    raise NotImplementedError("Semantic mapper factory is proprietary")
+    cls = _MAPPER_REGISTRY.get(mapper_type)
+    if cls is None:
+        raise NotImplementedError(f"No semantic mapper registered as '{mapper_type}'")
+    return cls(config)
 
 
 def create_audio_synthesizer(synth_type: str, config: Dict) -> AudioSynthesizerInterface:
     """
     Factory function for creating audio synthesizers.
-    
+
     Args:
         synth_type: Type of synthesizer ('fluidsynth', 'pygame', etc.)
         config: Synthesizer configuration
-    
+
     Returns:
         Initialized audio synthesizer instance
     """
-    raise NotImplementedError("Audio synthesizer factory is proprietary")
+    cls = _SYNTHESIZER_REGISTRY.get(synth_type)
+    if cls is None:
+        raise NotImplementedError(f"No audio synthesizer registered as '{synth_type}'")
+    synthesizer = cls()
+    synthesizer.initialize_audio_system(config)
+    return synthesizer
 
 
 # Mock implementations for testing
+@register_generator("mock")
 class MockMusicGenerator(MusicGeneratorInterface):
     """Mock music generator for testing and demonstration."""
     
-    def __init__(self):
+    # EMA smoothing factor for the generation-time estimator.
+    _EMA_ALPHA = 0.2
+
+    def __init__(self, simulate_latency: bool = False):
         self.initialized = False
-    
+        # Off by default: the artificial sleep cripples CI runs and any
+        # benchmark that wires the mock into the real-time pipeline.
+        self.simulate_latency = simulate_latency
+        # Online estimate of observed generation time, so schedulers
+        # get predictions that track the generator's hot/cold state
+        # instead of a fixed duration heuristic.
+        self._ema_elapsed: Optional[float] = None
+        self._last_duration: Optional[float] = None
+
+    def _observe_generation(self, elapsed: float, duration: float) -> None:
+        """Fold an observed generation time into the EMA estimator."""
+        if self._ema_elapsed is None:
+            self._ema_elapsed = elapsed
+        else:
+            self._ema_elapsed = (
+                self._EMA_ALPHA * elapsed + (1.0 - self._EMA_ALPHA) * self._ema_elapsed
+            )
+        self._last_duration = duration
+
     def initialize(self, config: Dict) -> bool:
         self.initialized = True
         return True
-    
+
     def generate_music(self, parameters: MusicalParameters) -> GeneratedAudio:
         """Generate mock audio data."""
-        import time
-        
-        # Simulate generation time
-        time.sleep(min(2.0, parameters.duration * 0.1))
-        
+        np = _get_np()
+        start = time.perf_counter()
+
+        if self.simulate_latency:
+            time.sleep(min(2.0, parameters.duration * 0.1))
+
         # Generate simple sine wave as placeholder
         sample_rate = 44100
         duration = min(parameters.duration, 10.0)  # Limit for demo
         samples = int(sample_rate * duration)
         
         # Simple sine wave at frequency based on key
-        key_frequencies = {
-            "C": 261.63, "D": 293.66, "E": 329.63,
-            "F": 349.23, "G": 392.00, "A": 440.00, "B": 493.88
-        }
-        
-        freq = key_frequencies.get(parameters.key.tonic, 440.0)
-        t = np.linspace(0, duration, samples)
-        audio_data = 0.3 * np.sin(2 * np.pi * freq * t)
-        
+        freq = _tonic_freq(parameters.key.tonic)
+
+        # Pooled buffer filled in place: via the fused Numba kernel when
+        # available, otherwise from the per-tonic period cache, where
+        # only the first call for a tonic pays the transcendental
+        # evaluations. Steady-state generation allocates nothing either
+        # way.
+        audio_data = _acquire_buffer(samples)
+        fill = _get_sine_fill()
+        if fill is not None:
+            fill(audio_data, freq, sample_rate, 0.3)
+        else:
+            _fill_tiled(audio_data, _sine_period(parameters.key.tonic, freq, sample_rate))
+            audio_data *= np.float32(0.3)
+
+        # Elapsed time, not a wall-clock timestamp: schedulers read
+        # this field to budget generation ahead of playback.
+        elapsed = time.perf_counter() - start
+        self._observe_generation(elapsed, duration)
+
         return GeneratedAudio(
             audio_data=audio_data,
             sample_rate=sample_rate,
             duration=duration,
             parameters=parameters,
-            generation_time=time.time()
+            generation_time=elapsed
         )
     
+    def generate_music_batch(self, parameters: List[MusicalParameters]) -> List[GeneratedAudio]:
+        """Generate a batch of clips with one broadcast sine evaluation."""
+        np = _get_np()
+        start = time.perf_counter()
+
+        sample_rate = 44100
+        durations = [min(p.duration, 10.0) for p in parameters]
+        if len(set(durations)) != 1:
+            # Ragged batch: fall back to the per-clip path.
+            return super().generate_music_batch(parameters)
+
+        samples = int(sample_rate * durations[0])
+        freqs = np.array([_tonic_freq(p.key.tonic) for p in parameters], dtype=np.float32)
+        phase_step = np.arange(samples, dtype=np.float32) * np.float32(2.0 * np.pi / sample_rate)
+        audio = np.sin(freqs[:, None] * phase_step[None, :])
+        audio *= np.float32(0.3)
+
+        elapsed = time.perf_counter() - start
+        self._observe_generation(elapsed / len(parameters), durations[0])
+        return [
+            GeneratedAudio(
+                audio_data=audio[i],
+                sample_rate=sample_rate,
+                duration=durations[i],
+                parameters=p,
+                generation_time=elapsed,
+            )
+            for i, p in enumerate(parameters)
+        ]
+
+    def generate_music_stream(self, parameters: MusicalParameters,
+                              block_size: int = 1024) -> Iterator["np.ndarray"]:
+        """Synthesize the sine incrementally, one block at a time.
+
+        Peak memory is one block (~4 KB at the default size) instead of
+        the full clip, and the running phase carries across block
+        boundaries so the waveform stays continuous.
+        """
+        np = _get_np()
+
+        sample_rate = 44100
+        duration = min(parameters.duration, 10.0)
+        samples = int(sample_rate * duration)
+        freq = _tonic_freq(parameters.key.tonic)
+        step = np.float32(2.0 * np.pi * freq / sample_rate)
+
+        ramp = np.arange(block_size, dtype=np.float32)
+        phase = np.float32(0.0)
+        for offset in range(0, samples, block_size):
+            n = min(block_size, samples - offset)
+            block = np.sin(phase + step * ramp[:n])
+            block *= np.float32(0.3)
+            phase += step * np.float32(n)
+            yield block
+
     def generate_transition(self, from_params: MusicalParameters,
                           to_params: MusicalParameters,
                           transition_duration: float = 4.0) -> GeneratedAudio:
@@ -533,7 +914,16 @@ class MockMusicGenerator(MusicGeneratorInterface):
         return list(InstrumentFamily)
     
     def estimate_generation_time(self, parameters: MusicalParameters) -> float:
-        return min(2.0, parameters.duration * 0.1)
+        # Prediction tracks the EMA of observed generation times instead
+        # of a fixed fraction of the clip duration, so it adapts to the
+        # host the mock actually runs on. Scaled linearly by duration
+        # relative to the last observed clip; the old heuristic remains
+        # as the cold-start fallback before any clip has been generated.
+        if self._ema_elapsed is None:
+            return min(2.0, parameters.duration * 0.1)
+        if self._last_duration:
+            return self._ema_elapsed * (parameters.duration / self._last_duration)
+        return self._ema_elapsed
     
     def cleanup(self) -> None:
         self.initialized = False
@@ -8,8 +8,15 @@ Demonstrates clean architecture and design patterns.
 The actual implementations are proprietary and optimized for edge computing.
 """
 
+import functools
+import sys
+import time
 from abc import ABC, abstractmethod
-from typing import List, Dict, Optional, Tuple, Union
+from bisect import bisect_right
+from collections import deque
+from contextlib import contextmanager
+from types import MappingProxyType
+from typing import Callable, List, Dict, Optional, Tuple, Union
 from dataclasses import dataclass
 from enum import Enum
 import numpy as np
@@ -23,7 +30,27 @@ class ConfidenceLevel(Enum):
     VERY_HIGH = "very_high"
 
 
-@dataclass
+# Confidence bin edges shared by the scalar property and the batch
+# classifier: bin i covers [edge[i-1], edge[i]). The scalar path
+# bisects the plain tuples — bisect_right over a tuple compares native
+# floats, where an ndarray would box a NumPy scalar per probe — and
+# indexes enum members directly, skipping the Enum value-lookup
+# machinery. The NumPy mirrors below serve the vectorized path; the
+# edge array is float64 so the 0.9 edge compares exactly against both
+# float32 columns and Python floats (a float32 0.9 rounds above the
+# literal).
+_CONF_THRESHOLDS = (0.5, 0.75, 0.9)
+_LEVELS_TABLE = (ConfidenceLevel.LOW, ConfidenceLevel.MEDIUM,
+                 ConfidenceLevel.HIGH, ConfidenceLevel.VERY_HIGH)
+_CONF_THRESHOLDS_ARR = np.array(_CONF_THRESHOLDS, dtype=np.float64)
+_CONF_LEVELS = np.array(_LEVELS_TABLE, dtype=object)
+
+
+# slots=True drops the per-instance __dict__ (roughly a 3x footprint
+# cut for these small records, with faster attribute reads through slot
+# descriptors); frozen=True makes them hashable value objects. Derived
+# variants are produced with dataclasses.replace, not mutation.
+@dataclass(frozen=True, slots=True)
 class BoundingBox:
     """Represents a bounding box for detected objects."""
     x: int
@@ -33,16 +60,19 @@ class BoundingBox:
     
     @property
     def center(self) -> Tuple[int, int]:
-        """Calculate center point of bounding box."""
+        """Center point; scalar convenience for a single materialized box.
+
+        Whole-frame geometry should use DetectionBatch.centers().
+        """
         return (self.x + self.width // 2, self.y + self.height // 2)
-    
+
     @property
     def area(self) -> int:
-        """Calculate area of bounding box."""
+        """Area; scalar convenience — batches use DetectionBatch.areas()."""
         return self.width * self.height
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DetectedObject:
     """
     Represents a detected object with metadata.
@@ -55,7 +85,13 @@ class DetectedObject:
     confidence: float
     bounding_box: BoundingBox
     timestamp: float
-    
+
+    # Stable index into the processor's supported-classes table
+    # (DetectionBatch.cls). Downstream per-class lookups index arrays
+    # with it instead of comparing class_name strings; -1 means the
+    # producer did not assign one.
+    class_id: int = -1
+
     # Additional semantic properties for music mapping
     semantic_properties: Optional[Dict[str, float]] = None
     emotional_associations: Optional[Dict[str, float]] = None
@@ -63,21 +99,21 @@ class DetectedObject:
     @property
     def confidence_level(self) -> ConfidenceLevel:
         """Convert numerical confidence to categorical level."""
-        if self.confidence >= 0.9:
-            return ConfidenceLevel.VERY_HIGH
-        elif self.confidence >= 0.75:
-            return ConfidenceLevel.HIGH
-        elif self.confidence >= 0.5:
-            return ConfidenceLevel.MEDIUM
-        else:
-            return ConfidenceLevel.LOW
+        # Branchless bin lookup instead of the old if/elif ladder; the
+        # shared tables keep the thresholds in one place.
+        return _LEVELS_TABLE[bisect_right(_CONF_THRESHOLDS, self.confidence)]
     
     def is_reliable(self, threshold: float = 0.7) -> bool:
-        """Check if detection is reliable enough for music generation."""
+        """Check if detection is reliable enough for music generation.
+
+        The default is a fixed gate; streaming callers should pass the
+        processor's current_theta so the gate tracks the observed
+        confidence distribution (see DetectionBatch.filter_adaptive).
+        """
         return self.confidence >= threshold
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class FrameMetadata:
     """Metadata associated with a video frame."""
     frame_id: int
@@ -87,6 +123,429 @@ class FrameMetadata:
     lighting_conditions: Optional[str] = None
 
 
+class DetectionBatch:
+    """
+    Structure-of-arrays container for one frame's detections.
+
+    Columns are parallel contiguous NumPy arrays, so confidence
+    filtering, coordinate scaling and NMS run as single vectorized
+    sweeps over packed buffers instead of per-object Python attribute
+    chasing. DetectedObject stays as the boundary representation:
+    materialize it with to_objects() only when handing detections to
+    non-vectorized consumers.
+    """
+
+    __slots__ = ('x', 'y', 'w', 'h', 'conf', 'cls', 'ts', 'ids', 'class_names',
+                 '_buf')
+
+    def __init__(self, x: np.ndarray, y: np.ndarray, w: np.ndarray,
+                 h: np.ndarray, conf: np.ndarray, cls: np.ndarray,
+                 ts: np.ndarray, ids: np.ndarray,
+                 class_names: Tuple[str, ...] = ()):
+        # Geometry lives in four separate contiguous int32 columns
+        # rather than an (N, 4) matrix: per-component ops (centers,
+        # areas, ROI tests) then read unit-stride buffers that NumPy's
+        # inner loops vectorize, with no strided column gathers.
+        self.x = x          # (N,) int32 left edges
+        self.y = y          # (N,) int32 top edges
+        self.w = w          # (N,) int32 widths
+        self.h = h          # (N,) int32 heights
+        self.conf = conf    # (N,) float32 confidence scores
+        self.cls = cls      # (N,) int32 indices into class_names
+        self.ts = ts        # (N,) float64 detection timestamps
+        self.ids = ids      # (N,) <U16 object identifiers
+        self.class_names = tuple(class_names)
+        self._buf = None    # backing block when built via packed()
+
+    def __len__(self) -> int:
+        return len(self.conf)
+
+    @classmethod
+    def packed(cls, n: int, class_names: Tuple[str, ...] = ()) -> 'DetectionBatch':
+        """Allocate a batch whose 32-bit columns share one buffer.
+
+        A single (6, n) float32 block holds x/y/w/h/conf/cls as
+        contiguous row views (integer columns reinterpreted with
+        .view(np.int32)), so the whole geometry/score table exports
+        zero-copy through the array protocol. ts (float64) and ids
+        (unicode) cannot alias a 32-bit block and stay separate.
+        """
+        buf = np.empty((6, n), dtype=np.float32)
+        batch = cls(
+            buf[0].view(np.int32), buf[1].view(np.int32),
+            buf[2].view(np.int32), buf[3].view(np.int32),
+            buf[4], buf[5].view(np.int32),
+            np.empty(n, dtype=np.float64), np.empty(n, dtype='U16'),
+            class_names,
+        )
+        batch._buf = buf
+        return batch
+
+    @classmethod
+    def empty(cls, n: int,
+              class_names: Tuple[str, ...] = ()) -> 'DetectionBatch':
+        """Pre-size a batch for n detections, to be filled in place.
+
+        Producers that know the detection count up front write straight
+        into the columns instead of growing a Python list append by
+        append (each doubling reallocates and copies the whole list).
+        Columns are uninitialized, as with np.empty.
+        """
+        return cls.packed(n, class_names)
+
+    def __array__(self, dtype=None) -> np.ndarray:
+        """Export the 32-bit columns as a (6, N) array.
+
+        Zero-copy for packed batches (torch.from_numpy and friends wrap
+        the backing block directly); unpacked batches assemble a
+        bitwise-equivalent copy.
+        """
+        buf = self._buf
+        if buf is None:
+            buf = np.stack((
+                self.x.view(np.float32), self.y.view(np.float32),
+                self.w.view(np.float32), self.h.view(np.float32),
+                self.conf, self.cls.view(np.float32),
+            ))
+        return np.asarray(buf, dtype=dtype)
+
+    @property
+    def __array_interface__(self):
+        if self._buf is None:
+            # Fall back to __array__ for unpacked batches.
+            raise AttributeError('__array_interface__')
+        return self._buf.__array_interface__
+
+    def centers(self) -> np.ndarray:
+        """Box centers as an (N, 2) int32 array, one ufunc per axis.
+
+        Replaces N BoundingBox.center property calls with two adds and
+        two shifts over contiguous columns; keep the scalar property
+        for code holding a single materialized object.
+        """
+        return np.column_stack((self.x + (self.w >> 1), self.y + (self.h >> 1)))
+
+    def areas(self) -> np.ndarray:
+        """Box areas as an (N,) int32 array via one elementwise multiply."""
+        return self.w * self.h
+
+    def confidence_levels(self) -> np.ndarray:
+        """Categorical ConfidenceLevel per detection, as an object array.
+
+        One branchless np.searchsorted over the conf column plus one
+        fancy-index into the level table, replacing N evaluations of
+        the scalar if/elif ladder.
+        """
+        return _CONF_LEVELS[np.searchsorted(_CONF_THRESHOLDS_ARR, self.conf, side='right')]
+
+    def __iter__(self):
+        """Iterate detections as one reused DetectionView cursor.
+
+        A single proxy is advanced across the whole batch, so iterating
+        200 detections allocates one object instead of 200. The yielded
+        view is only valid until the next iteration step: consumers that
+        need to retain a detection must call view.materialize().
+        """
+        view = DetectionView(self, 0)
+        for i in range(len(self)):
+            view._i = i
+            yield view
+
+    def materialize(self, i: int) -> 'DetectedObject':
+        """Build a real DetectedObject for row i."""
+        return DetectedObject(
+            object_id=str(self.ids[i]),
+            class_name=self.class_names[self.cls[i]],
+            confidence=float(self.conf[i]),
+            bounding_box=BoundingBox(
+                int(self.x[i]), int(self.y[i]),
+                int(self.w[i]), int(self.h[i]),
+            ),
+            timestamp=float(self.ts[i]),
+            class_id=int(self.cls[i]),
+        )
+
+    def __getitem__(self, selector) -> Union['DetectionView', 'DetectionBatch']:
+        """Index one detection, or subset with a mask or index array.
+
+        An integer returns a fresh DetectionView (safe to hold, unlike
+        the cursor reused by iteration). Boolean masks and index arrays
+        return a new batch: one advanced-indexing pass per column, with
+        the class-name table shared rather than copied.
+        """
+        if isinstance(selector, (int, np.integer)):
+            index = int(selector)
+            if index < 0:
+                index += len(self)
+            if not 0 <= index < len(self):
+                raise IndexError("detection index out of range")
+            return DetectionView(self, index)
+        return DetectionBatch(
+            self.x[selector], self.y[selector],
+            self.w[selector], self.h[selector],
+            self.conf[selector], self.cls[selector],
+            self.ts[selector], self.ids[selector],
+            self.class_names,
+        )
+
+    def filter_adaptive(self, alpha: float = 1.0) -> 'DetectionBatch':
+        """Keep detections scoring at least mu - alpha*sigma of the batch.
+
+        A distribution-aware gate instead of a hard-coded 0.7: the
+        threshold follows the batch's own confidence statistics, so a
+        frame full of strong detections is pruned harder than a sparse
+        dim one. Costs one mean/std sweep plus one vectorized compare.
+        """
+        if len(self) == 0:
+            return self
+        theta = max(float(self.conf.mean()) - alpha * float(self.conf.std()), 0.0)
+        return self[self.conf >= theta]
+
+    @classmethod
+    def from_objects(cls, objects: List['DetectedObject'],
+                     class_names: Optional[Tuple[str, ...]] = None) -> 'DetectionBatch':
+        """Pack DetectedObject instances into parallel columns.
+
+        When class_names is the producer's table, objects carrying a
+        class_id skip the name lookup entirely; with a derived table
+        the ids would not line up, so names are used.
+        """
+        use_ids = class_names is not None
+        if class_names is None:
+            class_names = tuple(dict.fromkeys(obj.class_name for obj in objects))
+        index = {name: i for i, name in enumerate(class_names)}
+
+        batch = cls.packed(len(objects), class_names)
+        for i, obj in enumerate(objects):
+            box = obj.bounding_box
+            batch.x[i], batch.y[i] = box.x, box.y
+            batch.w[i], batch.h[i] = box.width, box.height
+            batch.conf[i] = obj.confidence
+            batch.cls[i] = obj.class_id if use_ids and obj.class_id >= 0 \
+                else index[obj.class_name]
+            batch.ts[i] = obj.timestamp
+            batch.ids[i] = obj.object_id
+        return batch
+
+    def to_objects(self) -> List['DetectedObject']:
+        """Materialize boundary DetectedObject instances from the columns."""
+        return [self.materialize(i) for i in range(len(self))]
+
+
+class DetectionView:
+    """
+    Cursor exposing one DetectionBatch row through the DetectedObject
+    accessors.
+
+    Holds only (batch, index) and reads the SoA columns on demand, so
+    iterating a batch allocates no per-detection dataclasses. Views
+    obtained from iteration are rewritten in place each step; call
+    materialize() to get a DetectedObject that outlives the cursor.
+    """
+
+    __slots__ = ('_batch', '_i')
+
+    def __init__(self, batch: DetectionBatch, index: int):
+        self._batch = batch
+        self._i = index
+
+    @property
+    def object_id(self) -> str:
+        return str(self._batch.ids[self._i])
+
+    @property
+    def class_id(self) -> int:
+        return int(self._batch.cls[self._i])
+
+    @property
+    def class_name(self) -> str:
+        return self._batch.class_names[self._batch.cls[self._i]]
+
+    @property
+    def confidence(self) -> float:
+        return float(self._batch.conf[self._i])
+
+    @property
+    def bounding_box(self) -> BoundingBox:
+        return BoundingBox(
+            int(self._batch.x[self._i]), int(self._batch.y[self._i]),
+            int(self._batch.w[self._i]), int(self._batch.h[self._i]),
+        )
+
+    @property
+    def timestamp(self) -> float:
+        return float(self._batch.ts[self._i])
+
+    @property
+    def confidence_level(self) -> ConfidenceLevel:
+        return _LEVELS_TABLE[bisect_right(_CONF_THRESHOLDS, self.confidence)]
+
+    def is_reliable(self, threshold: float = 0.7) -> bool:
+        return self.confidence >= threshold
+
+    def materialize(self) -> DetectedObject:
+        """Promote this view to a standalone DetectedObject."""
+        return self._batch.materialize(self._i)
+
+
+class FramePool:
+    """
+    Bounded pool of preallocated frame buffers.
+
+    Preprocessing that returns a fresh array per call generates a
+    steady ~145 MB/s of allocator churn at 30 fps with 640x640x3
+    float32 frames. Leasing buffers from a fixed set instead makes the
+    steady-state pipeline allocation-free: each slot is paged in once
+    and stays warm in cache across frames.
+    """
+
+    def __init__(self, shape: Tuple[int, ...], dtype=np.float32, size: int = 4):
+        self.shape = tuple(shape)
+        self.dtype = np.dtype(dtype)
+        self._size = size
+        self._free = deque(np.empty(self.shape, self.dtype) for _ in range(size))
+
+    def acquire(self) -> np.ndarray:
+        """Take a buffer from the pool, allocating only when exhausted."""
+        try:
+            return self._free.popleft()
+        except IndexError:
+            return np.empty(self.shape, self.dtype)
+
+    def release(self, buffer: np.ndarray) -> None:
+        """Hand a buffer back; extras beyond the pool bound are dropped."""
+        if (buffer.shape == self.shape and buffer.dtype == self.dtype
+                and len(self._free) < self._size):
+            self._free.append(buffer)
+
+    @contextmanager
+    def lease(self):
+        """Context manager scoping one acquire/release pair."""
+        buffer = self.acquire()
+        try:
+            yield buffer
+        finally:
+            self.release(buffer)
+
+
+def _nms_numpy(x1: np.ndarray, y1: np.ndarray, x2: np.ndarray, y2: np.ndarray,
+               scores: np.ndarray, iou_threshold: float) -> np.ndarray:
+    """Greedy non-maximum suppression over corner boxes.
+
+    Each round keeps the highest-scoring survivor and suppresses its
+    overlaps with one vectorized IoU row, so the Python loop runs once
+    per kept box rather than once per candidate pair.
+    """
+    order = np.argsort(-scores)
+    areas = (x2 - x1) * (y2 - y1)
+    keep = []
+    while order.size:
+        i = order[0]
+        keep.append(i)
+        rest = order[1:]
+        xx1 = np.maximum(x1[i], x1[rest])
+        yy1 = np.maximum(y1[i], y1[rest])
+        xx2 = np.minimum(x2[i], x2[rest])
+        yy2 = np.minimum(y2[i], y2[rest])
+        inter = np.maximum(xx2 - xx1, 0.0) * np.maximum(yy2 - yy1, 0.0)
+        iou = inter / (areas[i] + areas[rest] - inter)
+        order = rest[iou <= iou_threshold]
+    return np.asarray(keep, dtype=np.int64)
+
+
+# Optional Numba NMS kernel, resolved lazily so neither the numba
+# import nor the first JIT compile is paid by code that never runs the
+# postprocess; numba remains an optional dependency.
+_NMS_KERNEL_UNSET = object()
+_nms_kernel = _NMS_KERNEL_UNSET
+
+# Candidate count below which the NumPy NMS wins: the broadcasting
+# path's per-round temporaries are cheaper than the kernel's call
+# overhead on small sets.
+_NMS_NUMBA_MIN = 64
+
+
+def _get_nms_kernel():
+    """Return the JIT-compiled NMS kernel, or None if numba is absent."""
+    global _nms_kernel
+    if _nms_kernel is _NMS_KERNEL_UNSET:
+        try:
+            from numba import njit, prange
+        except ImportError:
+            _nms_kernel = None
+        else:
+            @njit(parallel=True, fastmath=True, cache=True)
+            def _kernel(x1, y1, x2, y2, scores, iou_threshold):
+                order = np.argsort(-scores)
+                n = order.size
+                suppressed = np.zeros(n, dtype=np.bool_)
+                keep = np.empty(n, dtype=np.int64)
+                num_kept = 0
+                for oi in range(n):
+                    if suppressed[oi]:
+                        continue
+                    i = order[oi]
+                    keep[num_kept] = i
+                    num_kept += 1
+                    area_i = (x2[i] - x1[i]) * (y2[i] - y1[i])
+                    # Suppression checks against the kept box are
+                    # independent, so the sweep parallelizes.
+                    for oj in prange(oi + 1, n):
+                        if suppressed[oj]:
+                            continue
+                        j = order[oj]
+                        ix1 = max(x1[i], x1[j])
+                        iy1 = max(y1[i], y1[j])
+                        ix2 = min(x2[i], x2[j])
+                        iy2 = min(y2[i], y2[j])
+                        inter = max(ix2 - ix1, 0.0) * max(iy2 - iy1, 0.0)
+                        area_j = (x2[j] - x1[j]) * (y2[j] - y1[j])
+                        if inter / (area_i + area_j - inter) > iou_threshold:
+                            suppressed[oj] = True
+                return keep[:num_kept]
+
+            _nms_kernel = _kernel
+    return _nms_kernel
+
+
+def _nms(x1: np.ndarray, y1: np.ndarray, x2: np.ndarray, y2: np.ndarray,
+         scores: np.ndarray, iou_threshold: float) -> np.ndarray:
+    """Run NMS, dispatching on candidate count.
+
+    Large candidate sets go to the Numba kernel when available (native
+    parallel O(k^2) loop, no per-round temporaries); small sets and
+    numba-less installs use the NumPy path.
+    """
+    if len(scores) >= _NMS_NUMBA_MIN:
+        kernel = _get_nms_kernel()
+        if kernel is not None:
+            return kernel(x1, y1, x2, y2, scores, iou_threshold)
+    return _nms_numpy(x1, y1, x2, y2, scores, iou_threshold)
+
+
+# Shape-specialized preprocessing kernels, keyed by
+# (frame_shape, model_shape). A deployment runs one camera format into
+# one model input, so the scale factors, channel permutation and
+# normalization divisor are compile-time constants for that pair —
+# kernels registered here (e.g. Numba njit with hard-coded sizes) get
+# their loops fully unrolled/vectorized instead of re-deriving strides
+# per frame. Lookup happens once at initialize, not per frame.
+_PREPROC_SPECIALIZATIONS: Dict[
+    Tuple[Tuple[int, ...], Tuple[int, ...]], Callable] = {}
+
+
+def register_preprocessor(frame_shape: Tuple[int, ...],
+                          model_shape: Tuple[int, ...]) -> Callable[[Callable], Callable]:
+    """Decorator registering a preprocessing kernel for one shape pair.
+
+    The kernel takes (frame, out) and returns the preprocessed frame.
+    """
+    def decorator(func: Callable) -> Callable:
+        _PREPROC_SPECIALIZATIONS[(tuple(frame_shape), tuple(model_shape))] = func
+        return func
+    return decorator
+
+
 class VisionProcessorInterface(ABC):
     """
     Abstract interface for vision processing systems.
@@ -111,55 +570,156 @@ class VisionProcessorInterface(ABC):
         pass
     
     @abstractmethod
-    def detect_objects(self, frame: np.ndarray, 
-                      metadata: Optional[FrameMetadata] = None) -> List[DetectedObject]:
+    def detect_objects(self, frame: np.ndarray,
+                      metadata: Optional[FrameMetadata] = None) -> DetectionBatch:
         """
         Detect objects in a single frame.
-        
+
         Args:
             frame: Input image as numpy array (H, W, C)
             metadata: Optional frame metadata for context
-        
+
         Returns:
-            List of detected objects with confidence scores and positions
+            Detections as a structure-of-arrays DetectionBatch; callers
+            needing individual objects use batch.to_objects()
+
+        Timestamp contract: every detection in the returned batch
+        carries the frame's single capture timestamp — taken from
+        metadata.timestamp when metadata is provided, otherwise sampled
+        once per frame from time.monotonic(). One shared monotonic
+        stamp per frame is what the audio side correlates against;
+        wall-clock jumps or per-detection stamps break that sync.
         """
         pass
+
+    def detect_objects_batch(self, frames: np.ndarray,
+                            metadata: Optional[List[FrameMetadata]] = None) -> List[DetectionBatch]:
+        """
+        Detect objects across several frames in one call.
+
+        The default implementation loops over detect_objects. Backends
+        should override it to run one forward pass over the (B, H, W, C)
+        stack, amortizing kernel-launch and Python-dispatch overhead
+        over the batch; accumulate frames into a FramePool-leased
+        buffer to keep the capture loop allocation-free.
+
+        Args:
+            frames: Stacked input frames as a (B, H, W, C) array
+            metadata: Optional per-frame metadata, aligned with frames
+
+        Returns:
+            One DetectionBatch per frame, in order
+        """
+        if metadata is None:
+            return [self.detect_objects(frame) for frame in frames]
+        return [self.detect_objects(frame, meta)
+                for frame, meta in zip(frames, metadata)]
     
     @abstractmethod
-    def preprocess_frame(self, frame: np.ndarray) -> np.ndarray:
+    def preprocess_frame(self, frame: np.ndarray,
+                        out: Optional[np.ndarray] = None) -> np.ndarray:
         """
         Preprocess frame for optimal detection performance.
-        
+
         Args:
             frame: Raw input frame
-        
+            out: Optional destination buffer, typically leased from a
+                FramePool; implementations write into it instead of
+                allocating so the steady-state pipeline stays
+                allocation-free
+
         Returns:
-            Preprocessed frame ready for inference
+            Preprocessed frame ready for inference (out when provided)
         """
         pass
+
+    def _select_preprocessor(self, frame_shape: Tuple[int, ...],
+                             model_shape: Tuple[int, ...]) -> Optional[Callable]:
+        """Look up a shape-specialized preprocessing kernel.
+
+        Call once from initialize when the camera format and model
+        input size are known; returns None when only the generic path
+        exists. Implementations cache the result and dispatch to it in
+        preprocess_frame so the per-frame cost is one attribute read.
+        """
+        return _PREPROC_SPECIALIZATIONS.get(
+            (tuple(frame_shape), tuple(model_shape)))
     
     @abstractmethod
     def postprocess_detections(self, raw_detections: np.ndarray,
-                             original_shape: Tuple[int, int]) -> List[DetectedObject]:
+                             original_shape: Tuple[int, int]) -> DetectionBatch:
         """
         Postprocess raw model outputs into structured detections.
-        
+
         Args:
             raw_detections: Raw model output
             original_shape: Original frame dimensions for coordinate scaling
-        
+
         Returns:
-            List of structured detection objects
+            Thresholded, rescaled and deduplicated detections as a
+            DetectionBatch
         """
         pass
+
+    def _default_postprocess(self, raw_detections: np.ndarray,
+                             original_shape: Tuple[int, int],
+                             conf_threshold: float = 0.25,
+                             iou_threshold: float = 0.45,
+                             model_shape: Tuple[int, int] = (640, 640),
+                             metadata: Optional[FrameMetadata] = None) -> DetectionBatch:
+        """Decode a dense (N, 5 + num_classes) head output, vectorized.
+
+        Shared by implementations whose model emits the usual
+        YOLO-style rows (cx, cy, w, h, objectness, class scores).
+        Confidence masking, center-to-corner decode, rescale to the
+        original frame and class argmax are each one broadcast op over
+        the dense array; greedy NMS (class-aware via a per-class
+        coordinate offset) is the only loop, one iteration per kept
+        box. No per-candidate Python work anywhere. Detections are
+        stamped per the detect_objects timestamp contract: the frame's
+        metadata.timestamp when given, else one monotonic sample.
+        """
+        class_names = tuple(self.get_supported_classes())
+        raw = raw_detections[raw_detections[:, 4] >= conf_threshold]
+
+        conf = raw[:, 4].astype(np.float32)
+        cls_idx = raw[:, 5:].argmax(axis=1).astype(np.int32) if raw.shape[1] > 5 \
+            else np.zeros(len(raw), dtype=np.int32)
+        sx = original_shape[1] / model_shape[1]
+        sy = original_shape[0] / model_shape[0]
+        x1 = (raw[:, 0] - raw[:, 2] * 0.5) * sx
+        y1 = (raw[:, 1] - raw[:, 3] * 0.5) * sy
+        x2 = (raw[:, 0] + raw[:, 2] * 0.5) * sx
+        y2 = (raw[:, 1] + raw[:, 3] * 0.5) * sy
+
+        # Offsetting boxes by class pushes different classes apart, so
+        # one NMS pass is class-aware without a per-class loop.
+        shift = cls_idx.astype(np.float64) * (max(original_shape) + 1.0)
+        keep = _nms(x1 + shift, y1 + shift, x2 + shift, y2 + shift,
+                    conf, iou_threshold)
+
+        batch = DetectionBatch.packed(len(keep), class_names)
+        np.rint(x1[keep], out=batch.x, casting='unsafe')
+        np.rint(y1[keep], out=batch.y, casting='unsafe')
+        np.rint(x2[keep] - x1[keep], out=batch.w, casting='unsafe')
+        np.rint(y2[keep] - y1[keep], out=batch.h, casting='unsafe')
+        batch.conf[:] = conf[keep]
+        batch.cls[:] = cls_idx[keep]
+        batch.ts[:] = metadata.timestamp if metadata else time.monotonic()
+        batch.ids[:] = [f"obj_{i}" for i in range(len(keep))]
+        return batch
     
     @abstractmethod
-    def get_supported_classes(self) -> List[str]:
+    def get_supported_classes(self) -> Tuple[str, ...]:
         """
-        Get list of object classes that can be detected.
-        
+        Get the object classes that can be detected.
+
         Returns:
-            List of supported object class names
+            Immutable tuple of supported object class names; callers
+            may hold and share it without copying. DetectedObject
+            class_name values must be taken from this table (interned
+            strings), never rebuilt, so name comparisons short-circuit
+            on identity.
         """
         pass
     
@@ -224,15 +784,51 @@ class EdgeOptimizedVisionInterface(VisionProcessorInterface):
         """
         pass
     
-    @abstractmethod
+    # ROI state shared by the default helpers below; None means the
+    # whole frame is processed.
+    _roi: Optional[BoundingBox] = None
+
     def enable_region_of_interest(self, roi: BoundingBox) -> None:
         """
         Enable processing only within a specific region of interest.
-        
+
+        Contract: the ROI must be applied as a zero-copy NumPy slice
+        (see _crop_roi), never by copying the region out — a pointer
+        and stride adjustment instead of a per-frame memcpy of the
+        cropped pixels. Detection coordinates produced from a cropped
+        frame are frame-relative again after _restore_roi_coords.
+
         Args:
             roi: Bounding box defining the region to process
         """
-        pass
+        self._roi = roi
+
+    def disable_region_of_interest(self) -> None:
+        """Process full frames again."""
+        self._roi = None
+
+    def _crop_roi(self, frame: np.ndarray) -> np.ndarray:
+        """Return the ROI as a view of frame (frame itself if no ROI).
+
+        The slice shares frame's buffer (result.base is frame), so
+        inference reads the camera buffer in place.
+        """
+        roi = self._roi
+        if roi is None:
+            return frame
+        return frame[roi.y:roi.y + roi.height, roi.x:roi.x + roi.width]
+
+    def _restore_roi_coords(self, batch: DetectionBatch) -> DetectionBatch:
+        """Shift ROI-relative detections back to frame coordinates.
+
+        Two in-place broadcast adds over the SoA columns; a no-op when
+        no ROI is active.
+        """
+        roi = self._roi
+        if roi is not None:
+            batch.x += np.int32(roi.x)
+            batch.y += np.int32(roi.y)
+        return batch
 
 
 class SemanticAnalyzerInterface(ABC):
@@ -287,6 +883,79 @@ class SemanticAnalyzerInterface(ABC):
         pass
 
 
+def default_cache_key(detected_object: DetectedObject) -> Tuple[int, str, int, int, int]:
+    """Coarsened identity of a detection for semantic-feature caching.
+
+    Buckets area to 4096 px^2 and the center to a 16 px grid: the same
+    class at roughly the same size and position maps to the same key,
+    so small jitter between frames still hits the cache. class_name is
+    part of the key because class_id is -1 for objects whose producer
+    never assigned one — on id alone, two different classes at the same
+    coarse pose would collide and serve each other's cached features.
+    The name is interned (see get_supported_classes), so hashing it is
+    cheap.
+    """
+    box = detected_object.bounding_box
+    cx, cy = box.center
+    return (detected_object.class_id, detected_object.class_name,
+            box.area // 4096, cx // 16, cy // 16)
+
+
+class CachedSemanticAnalyzer(SemanticAnalyzerInterface):
+    """
+    Mixin that memoizes semantic feature extraction per coarse pose.
+
+    In a near-static scene the same object re-detected frame after
+    frame would re-run the semantic model for an identical answer.
+    Extraction results are cached under default_cache_key, so repeat
+    queries cost one dict probe instead of a model invocation; on
+    typical static indoor scenes the hit rate is high enough to reduce
+    analysis calls to near zero. Call invalidate() on scene changes
+    (camera move, lighting shift, scene-cut signal) so stale features
+    are dropped.
+
+    Subclasses implement _extract_semantic_features_impl instead of
+    extract_semantic_features.
+    """
+
+    _CACHE_SIZE = 4096
+
+    def __init__(self):
+        # Per-instance cache (a decorated method would share one cache
+        # across instances and keep them alive through self).
+        self._pending: Optional[DetectedObject] = None
+        self._cached_extract = functools.lru_cache(maxsize=self._CACHE_SIZE)(
+            self._extract_for_key)
+
+    @abstractmethod
+    def _extract_semantic_features_impl(self, detected_object: DetectedObject,
+                                        context: Optional[Dict] = None) -> Dict[str, float]:
+        """Actual extraction; runs only on cache misses."""
+        pass
+
+    def _extract_for_key(self, key: Tuple[int, str, int, int, int]) -> Dict[str, float]:
+        return self._extract_semantic_features_impl(self._pending)
+
+    def extract_semantic_features(self, detected_object: DetectedObject,
+                                context: Optional[Dict] = None) -> Dict[str, float]:
+        """Extract semantic features, served from cache when possible.
+
+        Contextful calls bypass the cache: context is unbounded and
+        would both defeat key coarsening and leak into cached entries.
+        """
+        if context:
+            return self._extract_semantic_features_impl(detected_object, context)
+        self._pending = detected_object
+        try:
+            return self._cached_extract(default_cache_key(detected_object))
+        finally:
+            self._pending = None
+
+    def invalidate(self) -> None:
+        """Drop all cached features; call when the scene changes."""
+        self._cached_extract.cache_clear()
+
+
 class CameraInterface(ABC):
     """
     Abstract interface for camera input systems.
@@ -358,6 +1027,25 @@ class CameraInterface(ABC):
 
 
 # Factory functions for creating instances
+def create_vision_processor(processor_type: str, config: Dict) -> VisionProcessorInterface:
+    """
+    Factory function for creating vision processors.
+
+    In the actual implementation, this would instantiate the appropriate
+    processor based on the type (PyTorch, TensorFlow, OpenVINO, etc.)
+
+    Args:
+        processor_type: Type of processor to create
+        config: Configuration for the processor
+
+    Returns:
+        Initialized vision processor instance
+    """
+    # This is a placeholder for the factory pattern
+    # Actual implementation would import and instantiate real processors
+    raise NotImplementedError("Factory implementation is proprietary")
+
+
 def create_camera(camera_type: str, config: Dict) -> CameraInterface:
     """
     Factory function for creating camera instances.
@@ -399,74 +1087,135 @@ class MockVisionProcessor(VisionProcessorInterface):
     
     def __init__(self):
         self.initialized = False
-        self.supported_classes = [
-            "plant", "book", "cup", "laptop", "phone", 
+        self._preproc = None
+        # Interned so every detection shares one string object per
+        # class and name equality short-circuits on identity.
+        self.supported_classes = [sys.intern(name) for name in (
+            "plant", "book", "cup", "laptop", "phone",
             "bottle", "clock", "lamp", "camera", "guitar"
-        ]
+        )]
+        # Static metadata frozen once: both accessors are called
+        # per-frame by consumers, and returning shared immutable
+        # objects beats re-copying a list / rebuilding a dict per call.
+        self._supported_classes_tuple = tuple(self.supported_classes)
+        # Bidirectional class/index mapping: detections carry the int
+        # class_id through the pipeline and resolve the display name
+        # only at the boundary.
+        self._class_to_id = {name: i for i, name in enumerate(self.supported_classes)}
+        self._id_to_class = self._supported_classes_tuple
+        self._model_info = MappingProxyType({
+            "model_name": "MockDetector",
+            "version": "1.0.0",
+            "framework": "PyTorch (Simulated)",
+            "input_size": (640, 640),
+            "num_classes": len(self.supported_classes),
+            "quantized": True,
+            "platform": "Cross-platform"
+        })
+        # Dedicated Generator: the PCG64-backed API draws faster than
+        # the legacy np.random globals and keeps the mock's stream
+        # isolated from any global seeding done by the host application.
+        self._rng = np.random.default_rng()
+        # EMA of the per-batch confidence distribution, feeding the
+        # adaptive mu - alpha*sigma threshold exposed as current_theta.
+        self._mu_ema: Optional[float] = None
+        self._sigma_ema: Optional[float] = None
+
+    # Smoothing weight for the confidence-statistics EMA and the sigma
+    # multiplier of the adaptive threshold.
+    _EMA_WEIGHT = 0.2
+    _THETA_ALPHA = 1.0
+
+    @property
+    def current_theta(self) -> float:
+        """Adaptive reliability threshold tracking recent detections.
+
+        Returns the streaming mu - alpha*sigma estimate, or the 0.7
+        fixed default before any detections have been observed. Pass
+        this to DetectedObject.is_reliable for data-driven gating.
+        """
+        if self._mu_ema is None:
+            return 0.7
+        return max(self._mu_ema - self._THETA_ALPHA * self._sigma_ema, 0.0)
+
+    def _observe_confidences(self, conf: np.ndarray) -> None:
+        """Fold a batch's confidence statistics into the EMA state."""
+        mu, sigma = float(conf.mean()), float(conf.std())
+        if self._mu_ema is None:
+            self._mu_ema, self._sigma_ema = mu, sigma
+        else:
+            w = self._EMA_WEIGHT
+            self._mu_ema = w * mu + (1.0 - w) * self._mu_ema
+            self._sigma_ema = w * sigma + (1.0 - w) * self._sigma_ema
     
     def initialize(self, config: Dict) -> bool:
         """Initialize mock processor."""
+        # Resolve any shape-specialized preprocessing kernel up front;
+        # the per-frame dispatch is then a single attribute read.
+        frame_shape = tuple(config.get("frame_shape", ()))
+        model_shape = tuple(config.get("input_size", (640, 640)))
+        self._preproc = self._select_preprocessor(frame_shape, model_shape)
         self.initialized = True
         return True
     
-    def detect_objects(self, frame: np.ndarray, 
-                      metadata: Optional[FrameMetadata] = None) -> List[DetectedObject]:
-        """Mock object detection returning random objects."""
+    def detect_objects(self, frame: np.ndarray,
+                      metadata: Optional[FrameMetadata] = None) -> DetectionBatch:
+        """Mock object detection returning 1-3 random detections."""
+        class_names = self._supported_classes_tuple
         if not self.initialized:
-            return []
-        
-        # Simulate detection of 1-3 objects
-        import random
-        import time
-        
-        num_objects = random.randint(1, 3)
-        detections = []
-        
-        for i in range(num_objects):
-            class_name = random.choice(self.supported_classes)
-            confidence = random.uniform(0.6, 0.95)
-            
-            # Random bounding box
-            x = random.randint(0, frame.shape[1] - 100)
-            y = random.randint(0, frame.shape[0] - 100)
-            w = random.randint(50, 150)
-            h = random.randint(50, 150)
-            
-            detection = DetectedObject(
-                object_id=f"obj_{i}",
-                class_name=class_name,
-                confidence=confidence,
-                bounding_box=BoundingBox(x, y, w, h),
-                timestamp=time.time()
-            )
-            detections.append(detection)
-        
-        return detections
+            return DetectionBatch.empty(0, class_names)
+
+        # All columns are drawn in batched NumPy calls and packed
+        # straight into the SoA layout; no per-detection Python loop.
+        rng = self._rng
+        num_objects = int(rng.integers(1, 4))
+        batch = DetectionBatch.empty(num_objects, class_names)
+        batch.cls[:] = rng.integers(0, len(class_names), size=num_objects, dtype=np.int32)
+        batch.conf[:] = rng.uniform(0.6, 0.95, size=num_objects)
+
+        # Random bounding boxes, SWAR-style: one 64-bit draw carries
+        # all four box fields as 16-bit lanes, unpacked with shifts and
+        # masks — one RNG call instead of four. Lane values are reduced
+        # modulo the valid placement/size ranges (the modulo bias is
+        # irrelevant for mock data).
+        raw = rng.integers(0, 1 << 64, size=num_objects, dtype=np.uint64)
+        batch.x[:] = (raw & np.uint64(0xFFFF)).astype(np.int32) \
+            % max(1, frame.shape[1] - 100)
+        batch.y[:] = ((raw >> np.uint64(16)) & np.uint64(0xFFFF)).astype(np.int32) \
+            % max(1, frame.shape[0] - 100)
+        batch.w[:] = 50 + ((raw >> np.uint64(32)) & np.uint64(0xFFFF)).astype(np.int32) % 101
+        batch.h[:] = 50 + ((raw >> np.uint64(48)) & np.uint64(0xFFFF)).astype(np.int32) % 101
+
+        # One timestamp per frame, per the interface contract: the
+        # capture time when metadata carries it, else a single
+        # monotonic sample (immune to wall-clock jumps).
+        batch.ts[:] = metadata.timestamp if metadata else time.monotonic()
+        batch.ids[:] = [f"obj_{i}" for i in range(num_objects)]
+        self._observe_confidences(batch.conf)
+        return batch
     
-    def preprocess_frame(self, frame: np.ndarray) -> np.ndarray:
-        """Mock preprocessing - just return the frame."""
+    def preprocess_frame(self, frame: np.ndarray,
+                        out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Mock preprocessing - pass through, or fill the pooled buffer."""
+        if self._preproc is not None:
+            return self._preproc(frame, out)
+        if out is not None:
+            np.copyto(out, frame, casting='unsafe')
+            return out
         return frame
     
     def postprocess_detections(self, raw_detections: np.ndarray,
-                             original_shape: Tuple[int, int]) -> List[DetectedObject]:
-        """Mock postprocessing."""
-        return []
-    
-    def get_supported_classes(self) -> List[str]:
-        """Return supported object classes."""
-        return self.supported_classes.copy()
+                             original_shape: Tuple[int, int]) -> DetectionBatch:
+        """Run the shared vectorized decode/NMS over the raw output."""
+        return self._default_postprocess(raw_detections, original_shape)
     
+    def get_supported_classes(self) -> Tuple[str, ...]:
+        """Return the cached tuple of supported object classes."""
+        return self._supported_classes_tuple
+
     def get_model_info(self) -> Dict:
-        """Return mock model information."""
-        return {
-            "model_name": "MockDetector",
-            "version": "1.0.0",
-            "framework": "PyTorch (Simulated)",
-            "input_size": (640, 640),
-            "num_classes": len(self.supported_classes),
-            "quantized": True,
-            "platform": "Cross-platform"
-        }
+        """Return the cached read-only model information mapping."""
+        return self._model_info
     
     def cleanup(self) -> None:
         """Clean up mock processor."""
@@ -483,8 +1232,12 @@ __all__ = [
     'VisionProcessorInterface',
     'EdgeOptimizedVisionInterface', 
     'SemanticAnalyzerInterface',
+    'CachedSemanticAnalyzer',
     'CameraInterface',
     'DetectedObject',
+    'DetectionBatch',
+    'DetectionView',
+    'FramePool',
     'BoundingBox',
     'FrameMetadata',
     'ConfidenceLevel',
@@ -492,23 +1245,4 @@ __all__ = [
     'create_camera',
     'create_semantic_analyzer',
     'MockVisionProcessor'
-]vision_processor(processor_type: str, config: Dict) -> VisionProcessorInterface:
-    """
-    Factory function for creating vision processors.
-    
-    In the actual implementation, this would instantiate the appropriate
-    processor based on the type (PyTorch, TensorFlow, OpenVINO, etc.)
-    
-    Args:
-        processor_type: Type of processor to create
-        config: Configuration for the processor
-    
-    Returns:
-        Initialized vision processor instance
-    """
-    # This is a placeholder for the factory pattern
-    # Actual implementation would import and instantiate real processors
-    raise NotImplementedError("Factory implementation is proprietary")
-
-
-def create_
\ No newline at end of file
+]
\ No newline at end of file
@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""
+AI Audio Vision Lab - Edge Audio Classifier Training
+Copyright (c) 2025 Antonio Mainenti
+
+Trains a small Conv1d classifier on MFCC features for on-device audio
+event detection (clap / silence / whistle), targeting Raspberry Pi
+deployment alongside the vision pipeline.
+"""
+
+import os
+import re
+
+import numpy as np
+import torch
+import torch.nn as nn
+import torch.nn.functional as F
+import torchaudio
+from torch.utils.data import DataLoader, Dataset
+
+SAMPLE_RATE = 16000
+N_MFCC = 13
+NUM_EPOCHS = 20
+
+# Tensor-native MFCC: the mel filterbank and DCT run as fused torch ops
+# (batched FFT via MKL / NEON) instead of librosa's per-call NumPy path.
+mfcc_transform = torchaudio.transforms.MFCC(
+    sample_rate=SAMPLE_RATE,
+    n_mfcc=N_MFCC,
+    melkwargs={"n_fft": 400, "hop_length": 160, "n_mels": 64},
+)
+
+
+class AudioDataset(Dataset):
+    """Dataset of labelled WAV clips converted to MFCC features.
+
+    MFCCs are precomputed once at construction time so that
+    ``__getitem__`` is a plain in-memory lookup: with 20 epochs the
+    alternative is decoding and re-extracting the exact same features
+    20 times per file, which makes feature extraction the training
+    bottleneck on a Raspberry Pi.
+    """
+
+    label_map = {"clap": 0, "silence": 1, "whistle": 2}
+
+    label_pattern = re.compile("|".join(map(re.escape, label_map)))
+
+    def __init__(self, folder: str):
+        # Single compiled-regex pass over a scandir iterator (no extra
+        # stat per entry) instead of a files x labels substring scan;
+        # labels live in one int64 array rather than a Python list.
+        self.files = []
+        labels = []
+        for entry in os.scandir(folder):
+            if not entry.name.endswith(".wav"):
+                continue
+            match = self.label_pattern.search(entry.name)
+            if match is None:
+                continue
+            self.files.append(entry.path)
+            labels.append(self.label_map[match.group()])
+        self.labels = np.asarray(labels, dtype=np.int64)
+
+        # One decode + MFCC pass per file for the whole run instead of
+        # one per epoch. torchaudio.load yields a tensor directly, so
+        # there is no NumPy roundtrip before the transform.
+        self.mfccs = []
+        for path in self.files:
+            waveform, sr = torchaudio.load(path)
+            if sr != SAMPLE_RATE:
+                waveform = torchaudio.functional.resample(waveform, sr, SAMPLE_RATE)
+            # Stored contiguous FP32 so stacking in the collate_fn is a
+            # straight copy with no hidden strided reads.
+            self.mfccs.append(mfcc_transform(waveform).squeeze(0).float().contiguous())
+
+    def __len__(self):
+        return len(self.files)
+
+    def __getitem__(self, idx):
+        return self.mfccs[idx], self.labels[idx]
+
+
+def collate(batch):
+    """Pad MFCCs to the longest time dim in the batch and stack.
+
+    The default collate cannot stack ragged (n_mfcc, T) tensors, which
+    silently limits training to trivial batch sizes; padding here makes
+    real batching possible so the convs see well-filled GEMMs.
+    """
+    xs, ys = zip(*batch)
+    max_t = max(x.shape[1] for x in xs)
+    xs = torch.stack([F.pad(x, (0, max_t - x.shape[1])) for x in xs])
+    # Layout is fixed here, once per batch: the training loop must not
+    # reshape per step. Catches (B, T, n_mfcc)-shaped regressions early.
+    assert xs.shape[1] == N_MFCC, f"expected (B, {N_MFCC}, T), got {tuple(xs.shape)}"
+    # Dense FP32 layout keeps Conv1d on the fast MKLDNN/cuDNN paths
+    # instead of falling back to generic strided kernels.
+    return xs.contiguous(), torch.tensor(ys)
+
+
+class AudioClassifier(nn.Module):
+    """Small depthwise-separable Conv1d stack over MFCC frames.
+
+    A per-channel depthwise conv followed by a 1x1 pointwise mix has a
+    fraction of the MACs of the plain two-layer conv stack it replaced,
+    with comparable capacity for 3-class audio events -- the right
+    trade for Raspberry Pi inference.
+    """
+
+    def __init__(self, num_classes: int = 3):
+        super().__init__()
+        self.conv = nn.Sequential(
+            nn.Conv1d(N_MFCC, N_MFCC, kernel_size=3, groups=N_MFCC),
+            nn.Conv1d(N_MFCC, 64, kernel_size=1),
+            nn.ReLU(),
+            nn.AdaptiveAvgPool1d(1),
+        )
+        self.fc = nn.Linear(64, num_classes)
+
+    def forward(self, x):
+        x = self.conv(x)
+        return self.fc(x.squeeze(-1))
+
+
+def main(data_dir: str = "data/audio"):
+    device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
+    dataset = AudioDataset(data_dir)
+    # Multi-worker loading overlaps dataset-side work with the model
+    # step; persistent workers avoid re-forking every epoch. With the
+    # precomputed MFCC cache the loader cost is essentially a memcpy.
+    loader = DataLoader(
+        dataset,
+        batch_size=32,
+        shuffle=True,
+        collate_fn=collate,
+        num_workers=min(4, os.cpu_count() or 1),
+        persistent_workers=True,
+        pin_memory=device.type == "cuda",
+        prefetch_factor=4,
+    )
+
+    model = AudioClassifier().to(device)
+    if hasattr(torch, "compile"):
+        # Fuses the conv/relu/pool/linear stack into one generated
+        # kernel, cutting per-op dispatch overhead that dominates this
+        # tiny model. Older PyTorch simply runs eager.
+        model = torch.compile(model, mode="reduce-overhead")
+    optimizer = torch.optim.Adam(model.parameters(), lr=1e-3)
+    criterion = nn.CrossEntropyLoss()
+
+    for epoch in range(NUM_EPOCHS):
+        model.train()
+        running_loss = torch.zeros((), device=device)
+        for x, y in loader:
+            x, y = x.to(device), y.to(device)
+            # set_to_none skips a full zero-write sweep over parameter
+            # memory; grads are freshly allocated by the next backward.
+            optimizer.zero_grad(set_to_none=True)
+            # bfloat16 autocast halves bandwidth for the convs on
+            # tensor-core GPUs and BF16-capable CPUs; the optimizer
+            # state stays in FP32 so no GradScaler is needed.
+            with torch.autocast(device_type=device.type, dtype=torch.bfloat16):
+                out = model(x)
+                loss = criterion(out, y)
+            loss.backward()
+            optimizer.step()
+            # detach instead of item(): item() forces a device sync on
+            # every step, so the loss is read back once per epoch.
+            running_loss += loss.detach()
+
+        # inference_mode also skips view tracking and version counters,
+        # unlike no_grad, so the eval pass pays no autograd bookkeeping.
+        model.eval()
+        correct = 0
+        with torch.inference_mode():
+            for x, y in loader:
+                x, y = x.to(device), y.to(device)
+                correct += (model(x).argmax(dim=1) == y).sum().item()
+        accuracy = correct / len(dataset)
+        print(
+            f"Epoch {epoch + 1}/{NUM_EPOCHS} - "
+            f"loss: {running_loss.item() / len(loader):.4f} - acc: {accuracy:.3f}"
+        )
+
+    # Export as TorchScript for the Pi: no Python model class needed at
+    # load time, and optimize_for_inference folds constants and fuses
+    # ops. torch.compile wraps the module, so script the original.
+    export_model = getattr(model, "_orig_mod", model).cpu().eval()
+    scripted = torch.jit.script(export_model)
+    scripted = torch.jit.optimize_for_inference(scripted)
+    scripted.save("audio_classifier.ts")
+    print("Saved TorchScript model to audio_classifier.ts")
+
+    # int8 weights halve model bytes and let the Pi's NEON dot-product
+    # instructions chew through 4x more MACs per cycle than FP32. The
+    # runtime must select the ARM backend before loading:
+    # torch.backends.quantized.engine = "qnnpack".
+    quantized = torch.ao.quantization.quantize_dynamic(
+        export_model, {nn.Linear, nn.Conv1d}, dtype=torch.qint8
+    )
+    torch.jit.save(torch.jit.script(quantized), "audio_classifier_int8.ts")
+    print("Saved int8 TorchScript model to audio_classifier_int8.ts")
+
+    # ONNX export for ONNX Runtime on the Pi: ORT's graph optimizer
+    # constant-folds and fuses the conv/relu stack, and the runtime is a
+    # far smaller install than libtorch. Time dim and batch are dynamic.
+    dummy = torch.zeros(1, N_MFCC, 100)
+    torch.onnx.export(
+        export_model,
+        dummy,
+        "audio_classifier.onnx",
+        input_names=["mfcc"],
+        output_names=["logits"],
+        dynamic_axes={"mfcc": {0: "batch", 2: "time"}},
+        opset_version=17,
+    )
+    print("Saved ONNX model to audio_classifier.onnx")
+
+
+if __name__ == "__main__":
+    main()